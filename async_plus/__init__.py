@@ -1,11 +1,81 @@
-from pkg_resources import get_distribution, DistributionNotFound
+# Submodules are imported lazily on first access to keep `import async_plus`
+# cheap: most of them pull `asyncio` which is expensive to import.
+import importlib
+import sys
 
-from .retry import *
-from .tasks import *
-from .wait import *
 
+# Avoid importing `typing` at runtime, type checkers treat it as true anyway
+TYPE_CHECKING = False
+if TYPE_CHECKING:  # pragma: no cover
+    from .retry import *
+    from .tasks import *
+    from .wait import *
 
-try:
-    __version__ = get_distribution(__name__).version
-except DistributionNotFound:
-    pass
+
+_submodule_by_name = {
+    'RetryDelayer': 'retry',
+    'try_gather': 'tasks',
+    'launch_watched': 'tasks',
+    'task_scope': 'tasks',
+    'ScopeMetrics': 'tasks',
+    'TaskInfo': 'tasks',
+    'impatient': 'wait',
+}
+
+_submodules = {'retry', 'tasks', 'typing', 'wait'}
+
+__all__ = list(_submodule_by_name)
+
+# Failed lookup of version is cached too, so that `hasattr()` checks don't
+# scan installed distributions every time
+_version_not_found = False
+
+
+def _get_version():
+    global _version_not_found
+    if not _version_not_found:
+        version = _lookup_version()
+        if version is not None:
+            return version
+        _version_not_found = True
+    raise AttributeError(
+        f'module {__name__!r} has no attribute \'__version__\''
+    )
+
+
+def _metadata_module():
+    if sys.version_info >= (3, 8):
+        import importlib.metadata as metadata
+    else:
+        import importlib_metadata as metadata
+    return metadata
+
+
+def _lookup_version():
+    metadata = _metadata_module()
+    try:
+        return metadata.version(__name__)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def __getattr__(name):
+    if name in _submodule_by_name:
+        module = importlib.import_module(
+            f'.{_submodule_by_name[name]}', __name__,
+        )
+        value = getattr(module, name)
+    elif name in _submodules:
+        value = importlib.import_module(f'.{name}', __name__)
+    elif name == '__version__':
+        value = _get_version()
+    else:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}'
+        )
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__) | _submodules)
@@ -1,10 +1,15 @@
 import asyncio
+from bisect import bisect_left
+from collections import namedtuple
 from contextlib import asynccontextmanager
 import functools
 import logging
+from time import monotonic
 
 
-__all__ = ['try_gather', 'launch_watched', 'task_scope']
+__all__ = [
+    'try_gather', 'launch_watched', 'task_scope', 'ScopeMetrics', 'TaskInfo',
+]
 
 
 logger = logging.getLogger(__name__)
@@ -62,8 +67,26 @@ def launch_watched(coro, name=None, on_exception=None):
     return task
 
 
+def get_task_name(task):
+    # For compatibility with Python <3.8
+    try:
+        get_name = task.get_name
+    except AttributeError:
+        return None
+    else:
+        return get_name()
+
+
 @asynccontextmanager
-async def task_scope(on_exception=None):
+async def task_scope(
+    on_exception=None,
+    *,
+    on_launch=None,
+    on_finish=None,
+    on_cancel=None,
+    metrics=None,
+    track=False,
+):
     """Isolated scope of tasks.  All tasks launched in the scope are cancelled
     on exit.
 
@@ -73,8 +96,27 @@ async def task_scope(on_exception=None):
             scope.launch(coro1)
             scope.launch(coro2)
             await scope.wait()
+
+    Optional hooks are called as `on_launch(task)` when task is launched,
+    `on_finish(task, elapsed)` when it returns and `on_cancel(task, elapsed)`
+    when it's cancelled.  Tasks raising exception are reported to
+    `on_exception(task, exc)` as before.  Pass `ScopeMetrics` instance as
+    `metrics` to collect counters and durations.  Set `track` to list
+    running tasks with `scope.snapshot()` without any hooks.
+
+    Without hooks, metrics and `track` the scope costs the same as before:
+    start times are not recorded and no extra callbacks are attached to
+    tasks.  Otherwise each task gets a done callback and an entry with start
+    time that is removed when the task finishes.
     """
-    scope = _TaskScope(on_exception)
+    scope = _TaskScope(
+        on_exception,
+        on_launch=on_launch,
+        on_finish=on_finish,
+        on_cancel=on_cancel,
+        metrics=metrics,
+        track=track,
+    )
     try:
         yield scope
     finally:
@@ -84,11 +126,84 @@ async def task_scope(on_exception=None):
             await scope.wait(return_when=asyncio.ALL_COMPLETED)
 
 
+class ScopeMetrics:
+    """Counters and histogram of durations for tasks in `task_scope()`.
+
+    Usage example:
+
+        metrics = async_plus.ScopeMetrics()
+        async with async_plus.task_scope(metrics=metrics) as scope:
+            ...
+        logger.info(f'{metrics.failed} of {metrics.launched} tasks failed')
+
+    `durations[i]` is the number of completed tasks that took no more than
+    `buckets[i]` seconds (but more than `buckets[i - 1]`), the last item
+    counts tasks that took longer than `buckets[-1]`.
+    """
+
+    def __init__(self, buckets=(0.001, 0.01, 0.1, 1, 10, 60)):
+        self.buckets = tuple(sorted(buckets))
+        self.launched = 0
+        self.finished = 0
+        self.cancelled = 0
+        self.failed = 0
+        self.durations = [0] * (len(self.buckets) + 1)
+        self.total_duration = 0.0
+
+    def __repr__(self):
+        return (
+            f'<{type(self).__name__} launched={self.launched} '
+            f'finished={self.finished} cancelled={self.cancelled} '
+            f'failed={self.failed}>'
+        )
+
+    @property
+    def running(self):
+        return self.launched - self.finished - self.cancelled - self.failed
+
+    def _record(self, elapsed):
+        self.durations[bisect_left(self.buckets, elapsed)] += 1
+        self.total_duration += elapsed
+
+
+TaskInfo = namedtuple('TaskInfo', ['task', 'name', 'age'])
+
+
+def _call_hook(hook, task, *args):
+    try:
+        hook(task, *args)
+    except:
+        logger.exception(f'Exception in hook {hook!r} for {task!r}:')
+
+
 class _TaskScope:
 
-    def __init__(self, on_exception=None):
+    def __init__(
+        self,
+        on_exception=None,
+        *,
+        on_launch=None,
+        on_finish=None,
+        on_cancel=None,
+        metrics=None,
+        track=False,
+    ):
         self.tasks = set()
         self.default_on_exception = on_exception
+        self.on_launch = on_launch
+        self.on_finish = on_finish
+        self.on_cancel = on_cancel
+        self.metrics = metrics
+        self._instrumented = (
+            on_launch is not None or
+            on_finish is not None or
+            on_cancel is not None or
+            metrics is not None or
+            track
+        )
+        # Start times of running tasks in order of launching, filled only
+        # when instrumented
+        self._started = {}
 
     def __len__(self):
         return len(self.tasks)
@@ -98,8 +213,53 @@ class _TaskScope:
             on_exception = self.default_on_exception
         task = launch_watched(coro, on_exception=on_exception, **kwargs)
         self.tasks.add(task)
+        if self._instrumented:
+            self._started[task] = monotonic()
+            if self.metrics is not None:
+                self.metrics.launched += 1
+            if self.on_launch is not None:
+                _call_hook(self.on_launch, task)
+            task.add_done_callback(self._task_done_callback)
         return task
 
+    def _task_done_callback(self, task):
+        elapsed = monotonic() - self._started.pop(task)
+        metrics = self.metrics
+        if task.cancelled():
+            if metrics is not None:
+                metrics.cancelled += 1
+            hook = self.on_cancel
+        elif task.exception() is not None:
+            if metrics is not None:
+                metrics.failed += 1
+            # Reported via `on_exception`
+            hook = None
+        else:
+            if metrics is not None:
+                metrics.finished += 1
+            hook = self.on_finish
+        if metrics is not None:
+            metrics._record(elapsed)
+        if hook is not None:
+            _call_hook(hook, task, elapsed)
+
+    def snapshot(self):
+        """Return list of `TaskInfo(task, name, age)` for running tasks,
+        the oldest first.  Requires scope with hooks, metrics or `track` set.
+        """
+        if not self._instrumented:
+            raise RuntimeError(
+                'snapshot() requires task_scope() with track=True, hooks or '
+                'metrics'
+            )
+        now = monotonic()
+        # Done tasks whose callbacks are not called yet are still here
+        return [
+            TaskInfo(task, get_task_name(task), now - started)
+            for task, started in self._started.items()
+            if not task.done()
+        ]
+
     def cancel(self):
         for task in self.tasks:
             # Calling `cancel()` for task with exception would clear the
@@ -108,7 +268,9 @@ class _TaskScope:
                 task.cancel()
 
     async def wait(self, timeout=None, return_when=asyncio.FIRST_EXCEPTION):
-        await asyncio.wait_for(
+        """Wait for tasks according to `return_when` and return `(done,
+        pending)` sets of tasks like `asyncio.wait()` does."""
+        return await asyncio.wait_for(
             asyncio.wait(self.tasks, return_when=return_when),
             timeout=timeout,
         )
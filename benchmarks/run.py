@@ -0,0 +1,418 @@
+"""Benchmarks of async_plus primitives versus their stdlib counterparts.
+
+Usage:
+
+    python benchmarks/run.py --output results.json
+    python benchmarks/run.py --counts 10,1000000 --uvloop
+    python benchmarks/run.py --compare
+    python benchmarks/run.py --output benchmarks/baselines/<env>.json
+
+Each async_plus case is paired with stdlib one doing the same work, and the
+ratio of their timings is reported along with absolute numbers.  Regression
+check compares ratios, not absolute timings, so the stored baseline is
+meaningful on different machines.  Ratios do depend on Python version and
+event loop, so there is a separate baseline per environment, named like
+`cpython-3.11-asyncio.json`.  Comparing with baseline from different
+environment or without common results is an error.
+"""
+
+import argparse
+import asyncio
+from contextlib import asynccontextmanager
+import gc
+import json
+import os
+import platform
+import sys
+from time import perf_counter
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import async_plus  # noqa: E402
+
+
+DEFAULT_COUNTS = [10, 100, 1000, 10000, 100000]
+MIN_TASKS_PER_SAMPLE = 10000
+BASELINES_DIR = os.path.join(os.path.dirname(__file__), 'baselines')
+
+
+class Failure(Exception):
+    pass
+
+
+class BaselineMismatch(Exception):
+    pass
+
+
+async def instant():
+    pass
+
+
+async def eternal():
+    await asyncio.Future()
+
+
+async def falling():
+    await asyncio.sleep(0)
+    raise Failure()
+
+
+def _consume(task):
+    if not task.cancelled():
+        task.exception()
+
+
+# Each case is `async def case(n)`, the time of the whole call is measured
+
+
+async def gather_stdlib(n):
+    await asyncio.gather(*[instant() for _ in range(n)])
+
+
+async def gather_plus(n):
+    await async_plus.try_gather(*[instant() for _ in range(n)])
+
+
+async def gather_failing_stdlib(n):
+    tasks = [asyncio.ensure_future(eternal()) for _ in range(n - 1)]
+    try:
+        await asyncio.gather(falling(), *tasks)
+    except Failure:
+        pass
+    # Fair comparison: stdlib leaves tasks running, so clean them up
+    for task in tasks:
+        task.cancel()
+    await asyncio.wait(tasks)
+
+
+async def gather_failing_plus(n):
+    try:
+        await async_plus.try_gather(
+            falling(), *[eternal() for _ in range(n - 1)]
+        )
+    except Failure:
+        pass
+
+
+async def launch_stdlib(n):
+    tasks = [asyncio.create_task(instant()) for _ in range(n)]
+    await asyncio.wait(tasks)
+
+
+async def launch_plus(n):
+    tasks = [async_plus.launch_watched(instant()) for _ in range(n)]
+    await asyncio.wait(tasks)
+
+
+async def scope_plus(n):
+    async with async_plus.task_scope() as scope:
+        for _ in range(n):
+            scope.launch(instant())
+        await scope.wait(return_when=asyncio.ALL_COMPLETED)
+
+
+async def scope_instrumented_plus(n):
+    metrics = async_plus.ScopeMetrics()
+    async with async_plus.task_scope(metrics=metrics) as scope:
+        for _ in range(n):
+            scope.launch(instant())
+        await scope.wait(return_when=asyncio.ALL_COMPLETED)
+
+
+async def cancel_stdlib(n):
+    tasks = [asyncio.create_task(eternal()) for _ in range(n)]
+    await asyncio.sleep(0)
+    for task in tasks:
+        task.cancel()
+    await asyncio.wait(tasks)
+
+
+async def cancel_plus(n):
+    async with async_plus.task_scope() as scope:
+        for _ in range(n):
+            scope.launch(eternal())
+        await asyncio.sleep(0)
+
+
+async def scope_failing_stdlib(n):
+    tasks = [asyncio.create_task(eternal()) for _ in range(n - 1)]
+    tasks.append(asyncio.create_task(falling()))
+    await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+    for task in tasks:
+        if not task.done():
+            task.cancel()
+    await asyncio.wait(tasks)
+    for task in tasks:
+        _consume(task)
+
+
+async def scope_failing_plus(n):
+    async with async_plus.task_scope(on_exception=lambda *args: None) as scope:
+        for _ in range(n - 1):
+            scope.launch(eternal())
+        scope.launch(falling())
+        await scope.wait()
+
+
+async def await_stdlib(n):
+    # Bare `await instant()` doesn't touch event loop at all, so compare with
+    # the closest stdlib way to wait with timeout
+    for _ in range(n):
+        await asyncio.wait_for(instant(), 60)
+
+
+async def await_plus(n):
+    for _ in range(n):
+        await async_plus.impatient(instant(), log_after=60)
+
+
+# (name, stdlib case, async_plus case)
+CASES = [
+    ('gather', gather_stdlib, gather_plus),
+    ('gather_failing', gather_failing_stdlib, gather_failing_plus),
+    ('launch', launch_stdlib, launch_plus),
+    ('scope', launch_stdlib, scope_plus),
+    ('scope_instrumented', launch_stdlib, scope_instrumented_plus),
+    ('scope_failing', scope_failing_stdlib, scope_failing_plus),
+    ('cancel', cancel_stdlib, cancel_plus),
+    ('impatient', await_stdlib, await_plus),
+]
+
+
+# Spawners are async context managers returning function to launch task
+
+
+@asynccontextmanager
+async def create_task_spawner():
+    yield asyncio.create_task
+
+
+@asynccontextmanager
+async def launch_watched_spawner():
+    yield async_plus.launch_watched
+
+
+@asynccontextmanager
+async def scope_spawner():
+    async with async_plus.task_scope() as scope:
+        yield scope.launch
+
+
+# (name, stdlib spawner, async_plus spawner) for memory per task
+MEMORY_CASES = [
+    ('launch', create_task_spawner, launch_watched_spawner),
+    ('scope', create_task_spawner, scope_spawner),
+]
+
+
+def new_event_loop(use_uvloop):
+    if use_uvloop:
+        import uvloop
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+def measure_time(loop, cases, n, repeat):
+    """Return the best time of single `case(n)` call for each of `cases`.
+    Cases are run interleaved to reduce the effect of machine load changes,
+    small ones are run several times in a row to make measurement less
+    noisy."""
+    number = max(1, MIN_TASKS_PER_SAMPLE // n)
+
+    async def sample(case):
+        for _ in range(number):
+            await case(n)
+
+    best = [None] * len(cases)
+    for _ in range(repeat):
+        for idx, case in enumerate(cases):
+            gc.collect()
+            started = perf_counter()
+            loop.run_until_complete(sample(case))
+            elapsed = (perf_counter() - started) / number
+            if best[idx] is None or elapsed < best[idx]:
+                best[idx] = elapsed
+    return best
+
+
+def measure_memory(loop, spawner, n):
+    """Return memory allocated per running task launched with `spawner`."""
+
+    async def run():
+        async with spawner() as spawn:
+            gc.collect()
+            tracemalloc.start()
+            before, _ = tracemalloc.get_traced_memory()
+            tasks = [spawn(eternal()) for _ in range(n)]
+            await asyncio.sleep(0)
+            after, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            for task in tasks:
+                task.cancel()
+            await asyncio.wait(tasks)
+        return (after - before) / n
+
+    return loop.run_until_complete(run())
+
+
+def run(counts, repeat, use_uvloop):
+    loop = new_event_loop(use_uvloop)
+    results = []
+    try:
+        for name, stdlib_case, plus_case in CASES:
+            for n in counts:
+                stdlib_time, plus_time = measure_time(
+                    loop, [stdlib_case, plus_case], n, repeat,
+                )
+                result = {
+                    'name': name,
+                    'kind': 'time',
+                    'count': n,
+                    'stdlib': stdlib_time,
+                    'async_plus': plus_time,
+                    'ratio': plus_time / stdlib_time,
+                }
+                print(
+                    f'{name:>20} n={n:<8} stdlib={stdlib_time:.6f}s '
+                    f'async_plus={plus_time:.6f}s '
+                    f'ratio={result["ratio"]:.2f}',
+                    file=sys.stderr,
+                )
+                results.append(result)
+
+        for name, stdlib_spawn, plus_spawn in MEMORY_CASES:
+            n = max(counts)
+            stdlib_mem = measure_memory(loop, stdlib_spawn, n)
+            plus_mem = measure_memory(loop, plus_spawn, n)
+            result = {
+                'name': name,
+                'kind': 'memory_per_task',
+                'count': n,
+                'stdlib': stdlib_mem,
+                'async_plus': plus_mem,
+                'ratio': plus_mem / stdlib_mem,
+            }
+            print(
+                f'{name:>20} n={n:<8} stdlib={stdlib_mem:.0f}B '
+                f'async_plus={plus_mem:.0f}B ratio={result["ratio"]:.2f}',
+                file=sys.stderr,
+            )
+            results.append(result)
+    finally:
+        loop.close()
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'uvloop': use_uvloop,
+        'repeat': repeat,
+        'results': results,
+    }
+
+
+def environment(report):
+    """Return name of environment the report was made in, ratios are
+    comparable only for reports from the same environment."""
+    major_minor = '.'.join(report['python'].split('.')[:2])
+    loop = 'uvloop' if report['uvloop'] else 'asyncio'
+    return f'{report["implementation"].lower()}-{major_minor}-{loop}'
+
+
+def default_baseline(report):
+    return os.path.join(BASELINES_DIR, f'{environment(report)}.json')
+
+
+def compare(report, baseline, tolerance):
+    """Return `(regressions, missing)`: descriptions of results whose ratio
+    grew more than `tolerance` (relative) compared to `baseline` and of
+    results absent in `baseline`.  Raise `BaselineMismatch` when reports are
+    from different environments or have no results in common."""
+    if environment(report) != environment(baseline):
+        raise BaselineMismatch(
+            f'Report is for {environment(report)}, but baseline is for '
+            f'{environment(baseline)}'
+        )
+
+    baseline_ratios = {
+        (result['name'], result['kind'], result['count']): result['ratio']
+        for result in baseline['results']
+    }
+    regressions = []
+    missing = []
+    for result in report['results']:
+        key = (result['name'], result['kind'], result['count'])
+        expected = baseline_ratios.get(key)
+        if expected is None:
+            missing.append(
+                f'{result["name"]} ({result["kind"]}, n={result["count"]})'
+            )
+            continue
+        if result['ratio'] > expected * (1 + tolerance):
+            regressions.append(
+                f'{result["name"]} ({result["kind"]}, n={result["count"]}): '
+                f'ratio {result["ratio"]:.2f} > baseline {expected:.2f}'
+            )
+
+    if len(missing) == len(report['results']):
+        raise BaselineMismatch('No results in common with baseline')
+    return regressions, missing
+
+
+def parse_counts(value):
+    return [int(item) for item in value.split(',')]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[0])
+    parser.add_argument(
+        '--counts', type=parse_counts, default=DEFAULT_COUNTS,
+        help='comma-separated numbers of tasks (default: %(default)s)',
+    )
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument(
+        '--uvloop', action='store_true', help='run on uvloop event loop',
+    )
+    parser.add_argument('--output', help='write JSON report to this file')
+    parser.add_argument(
+        '--compare', nargs='?', const='', metavar='BASELINE',
+        help=(
+            'fail if ratios regressed compared to baseline report '
+            '(default: baseline for current environment in baselines/)'
+        ),
+    )
+    parser.add_argument(
+        '--tolerance', type=float, default=0.25,
+        help='allowed relative growth of ratio (default: %(default)s)',
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.counts, args.repeat, args.uvloop)
+
+    if args.output:
+        with open(args.output, 'w') as fp:
+            json.dump(report, fp, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    if args.compare is not None:
+        baseline_path = args.compare or default_baseline(report)
+        with open(baseline_path) as fp:
+            baseline = json.load(fp)
+        try:
+            regressions, missing = compare(report, baseline, args.tolerance)
+        except BaselineMismatch as exc:
+            print(f'ERROR: {exc} ({baseline_path})', file=sys.stderr)
+            return 2
+        for description in missing:
+            print(f'WARNING: not in baseline: {description}', file=sys.stderr)
+        for regression in regressions:
+            print(f'REGRESSION: {regression}', file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
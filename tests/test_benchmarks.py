@@ -0,0 +1,70 @@
+import importlib.util
+import os
+
+import pytest
+
+
+def load_benchmarks():
+    path = os.path.join(
+        os.path.dirname(__file__), '..', 'benchmarks', 'run.py',
+    )
+    spec = importlib.util.spec_from_file_location('benchmarks_run', path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+benchmarks = load_benchmarks()
+
+
+def make_report(ratios, python='3.11.7', uvloop=False):
+    return {
+        'python': python,
+        'implementation': 'CPython',
+        'uvloop': uvloop,
+        'repeat': 1,
+        'results': [
+            {'name': name, 'kind': 'time', 'count': count, 'ratio': ratio}
+            for (name, count), ratio in ratios.items()
+        ],
+    }
+
+
+def test_parse_counts():
+    assert benchmarks.parse_counts('10,1000000') == [10, 1000000]
+
+
+def test_environment():
+    assert benchmarks.environment(make_report({})) == 'cpython-3.11-asyncio'
+    assert (
+        benchmarks.environment(make_report({}, python='3.9.1', uvloop=True))
+        == 'cpython-3.9-uvloop'
+    )
+
+
+def test_compare():
+    baseline = make_report({('gather', 10): 1.0, ('scope', 10): 2.0})
+    report = make_report({
+        ('gather', 10): 1.2,
+        ('scope', 10): 2.6,
+        ('scope', 100): 5.0,
+    }, python='3.11.9')
+    regressions, missing = benchmarks.compare(report, baseline, 0.25)
+    assert regressions == ['scope (time, n=10): ratio 2.60 > baseline 2.00']
+    assert missing == ['scope (time, n=100)']
+
+
+def test_compare_no_common_results():
+    baseline = make_report({('gather', 10): 1.0})
+    report = make_report({('gather', 1000000): 5.0})
+    with pytest.raises(benchmarks.BaselineMismatch):
+        benchmarks.compare(report, baseline, 0.25)
+
+
+@pytest.mark.parametrize('kwargs', [{'python': '3.9.1'}, {'uvloop': True}])
+def test_compare_other_environment(kwargs):
+    baseline = make_report({('gather', 10): 1.0})
+    report = make_report({('gather', 10): 1.0}, **kwargs)
+    with pytest.raises(benchmarks.BaselineMismatch):
+        benchmarks.compare(report, baseline, 0.25)
@@ -0,0 +1,128 @@
+import importlib
+import subprocess
+import sys
+import types
+from unittest.mock import Mock
+
+import pytest
+
+import async_plus
+
+
+if sys.version_info >= (3, 8):
+    import importlib.metadata as importlib_metadata
+else:
+    import importlib_metadata
+
+
+# Generous enough to be stable on slow CI, but catches regressions like
+# importing `pkg_resources` or `asyncio` eagerly (tens of milliseconds)
+IMPORT_TIME_BUDGET_US = 20_000
+
+
+def run_python(code):
+    return subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        capture_output=True, text=True, check=True,
+    )
+
+
+def test_import_is_lazy():
+    result = run_python(
+        'import sys\n'
+        'import async_plus\n'
+        'print(" ".join(sorted(sys.modules)))\n'
+    )
+    modules = set(result.stdout.split())
+    assert 'async_plus' in modules
+    assert not {
+        'asyncio', 'pkg_resources', 'async_plus.tasks', 'async_plus.retry',
+        'async_plus.wait',
+    } & modules
+
+
+def test_import_time_budget():
+    result = run_python('import async_plus')
+    # Lines look like `import time:  self [us] | cumulative | imported package`
+    [cumulative] = [
+        int(line.split('|')[1])
+        for line in result.stderr.splitlines()
+        if line.split('|')[-1].strip() == 'async_plus'
+    ]
+    assert cumulative < IMPORT_TIME_BUDGET_US
+
+
+@pytest.mark.parametrize('name', async_plus.__all__)
+def test_lazy_attributes(name):
+    assert name in dir(async_plus)
+    value = getattr(async_plus, name)
+    assert getattr(async_plus, name) is value
+
+
+def test_submodule_attribute():
+    from async_plus import tasks
+    assert async_plus.tasks is tasks
+
+
+def test_unknown_attribute():
+    with pytest.raises(AttributeError):
+        async_plus.no_such_attribute
+
+
+def test_lazy_names_match_submodules():
+    expected = {}
+    for module_name in ['retry', 'tasks', 'wait']:
+        module = importlib.import_module(f'async_plus.{module_name}')
+        for name in module.__all__:
+            expected[name] = module_name
+    assert async_plus._submodule_by_name == expected
+
+
+@pytest.fixture
+def fresh_version(monkeypatch):
+    monkeypatch.delitem(vars(async_plus), '__version__', raising=False)
+    monkeypatch.setattr(async_plus, '_version_not_found', False)
+
+
+def test_version(fresh_version):
+    try:
+        expected = importlib_metadata.version('async_plus')
+    except importlib_metadata.PackageNotFoundError:
+        with pytest.raises(AttributeError):
+            async_plus.__version__
+        assert not hasattr(async_plus, '__version__')
+    else:
+        assert async_plus.__version__ == expected
+
+
+def test_version_not_found_is_cached(fresh_version, monkeypatch):
+    lookup_version = Mock(return_value=None)
+    monkeypatch.setattr(async_plus, '_lookup_version', lookup_version)
+
+    assert not hasattr(async_plus, '__version__')
+    assert not hasattr(async_plus, '__version__')
+    lookup_version.assert_called_once_with()
+
+
+@pytest.mark.parametrize('installed', [True, False])
+def test_version_metadata_backend(fresh_version, monkeypatch, installed):
+    # Emulates metadata module (e.g. `importlib_metadata` backport on 3.7)
+
+    class PackageNotFoundError(Exception):
+        pass
+
+    def version(name):
+        assert name == 'async_plus'
+        if not installed:
+            raise PackageNotFoundError(name)
+        return '1.2.3'
+
+    metadata = types.SimpleNamespace(
+        version=version, PackageNotFoundError=PackageNotFoundError,
+    )
+    monkeypatch.setattr(async_plus, '_metadata_module', lambda: metadata)
+
+    if installed:
+        assert async_plus.__version__ == '1.2.3'
+    else:
+        assert not hasattr(async_plus, '__version__')
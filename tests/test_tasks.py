@@ -196,3 +196,134 @@ async def test_coroutine_scope_launch_custom_on_exception(caplog):
             await scope.wait()
 
     on_exception.assert_called_once_with(task, CustomException('FALLING_TASK'))
+
+
+async def test_coroutine_scope_wait_result():
+    async with async_plus.task_scope() as scope:
+        eternal_task = scope.launch(eternal())
+        instant_task = scope.launch(instant())
+        done, pending = await scope.wait(
+            return_when=asyncio.FIRST_COMPLETED,
+        )
+
+    assert done == {instant_task}
+    assert pending == {eternal_task}
+
+
+async def test_coroutine_scope_hooks(caplog):
+    on_launch = Mock()
+    on_finish = Mock()
+    on_cancel = Mock()
+    on_exception = Mock()
+
+    async with async_plus.task_scope(
+        on_exception=on_exception,
+        on_launch=on_launch,
+        on_finish=on_finish,
+        on_cancel=on_cancel,
+    ) as scope:
+        eternal_task = scope.launch(eternal())
+        instant_task = scope.launch(instant())
+        falling_task = scope.launch(falling())
+        await scope.wait()
+
+    assert on_launch.call_args_list == [
+        ((eternal_task,),), ((instant_task,),), ((falling_task,),),
+    ]
+    [(task, elapsed)] = [call.args for call in on_finish.call_args_list]
+    assert task is instant_task and elapsed >= 0
+    [(task, elapsed)] = [call.args for call in on_cancel.call_args_list]
+    assert task is eternal_task and elapsed >= 0
+    on_exception.assert_called_once_with(
+        falling_task, CustomException('FALLING_TASK'),
+    )
+    assert not caplog.matching(name='async_plus')
+
+
+async def test_coroutine_scope_bad_hook(caplog):
+
+    def on_finish(task, elapsed):
+        raise RuntimeError('Oops!')
+
+    with caplog.at_level(logging.ERROR):
+        async with async_plus.task_scope(on_finish=on_finish) as scope:
+            task = scope.launch(instant())
+            await scope.wait()
+
+    assert task.done() and not task.cancelled()
+    [rec] = caplog.matching(name='async_plus')
+    assert rec.exc_info is not None
+    assert rec.exc_info[0] is RuntimeError
+
+
+async def test_coroutine_scope_metrics(caplog):
+    metrics = async_plus.ScopeMetrics(buckets=[1, 0.05])
+
+    with caplog.at_level(logging.ERROR):
+        async with async_plus.task_scope(metrics=metrics) as scope:
+            scope.launch(eternal())
+            scope.launch(instant())
+            scope.launch(delayed(0.1))
+            scope.launch(falling())
+            assert metrics.launched == 4
+            assert metrics.running == 4
+            await asyncio.sleep(0.15)
+            assert metrics.running == 1
+
+    assert metrics.launched == 4
+    assert metrics.finished == 2
+    assert metrics.failed == 1
+    assert metrics.cancelled == 1
+    assert metrics.running == 0
+    assert metrics.buckets == (0.05, 1)
+    assert metrics.durations == [2, 2, 0]
+
+
+async def test_coroutine_scope_no_hooks(monkeypatch):
+    task_done_callback = Mock()
+    monkeypatch.setattr(
+        async_plus.tasks._TaskScope, '_task_done_callback',
+        task_done_callback,
+    )
+
+    async with async_plus.task_scope() as scope:
+        scope.launch(instant())
+        await scope.wait()
+        assert not scope._started
+        with pytest.raises(RuntimeError):
+            scope.snapshot()
+
+    task_done_callback.assert_not_called()
+
+
+async def test_coroutine_scope_tracking_pruned():
+    async with async_plus.task_scope(track=True) as scope:
+        eternal_task = scope.launch(eternal())
+        for _ in range(10):
+            scope.launch(instant())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert list(scope._started) == [eternal_task]
+        [info] = scope.snapshot()
+        assert isinstance(info, async_plus.TaskInfo)
+        assert info.task is eternal_task
+
+    assert not scope._started
+
+
+async def test_coroutine_scope_snapshot():
+    async with async_plus.task_scope(track=True) as scope:
+        eternal_task = scope.launch(eternal(), name='ETERNAL')
+        await asyncio.sleep(0.01)
+        scope.launch(instant())
+        delayed_task = scope.launch(delayed(1))
+        await asyncio.sleep(0)
+
+        [info1, info2] = scope.snapshot()
+
+    assert info1.task is eternal_task
+    assert info2.task is delayed_task
+    assert info1.age > info2.age >= 0
+    if hasattr(asyncio.Task, 'get_name'):
+        assert info1.name == 'ETERNAL'